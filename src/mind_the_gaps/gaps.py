@@ -1,12 +1,17 @@
-from bisect import bisect
+from bisect import bisect, bisect_left, bisect_right
 from collections.abc import Callable
 from dataclasses import dataclass, field
-from functools import total_ordering
 from operator import and_, attrgetter, or_, xor
 from typing import Literal, Protocol, Self
 
 __all__ = ["Endpoint", "Gaps"]
 
+_BOUNDARY_ORDER = {")": 0, "[": 1, "]": 2, "(": 3}
+"""Sweep order of boundaries of endpoints with equal values."""
+
+_VALUE_GETTER = attrgetter("value")
+"""Bisection key for lists of endpoints."""
+
 
 def sub(a: bool, b: bool) -> bool:
     """`a` and not `b`."""
@@ -20,7 +25,6 @@ class SupportsLessThan(Protocol):
         ...
 
 
-@total_ordering
 @dataclass(frozen=True, slots=True)
 class Endpoint[T: SupportsLessThan]:
     """An interval endpoint."""
@@ -39,7 +43,25 @@ class Endpoint[T: SupportsLessThan]:
         if self.value != other.value:
             return self.value < other.value
 
-        return self.boundary + other.boundary in {"[(", ")]", "][", "](", ")[", ")("}
+        return _BOUNDARY_ORDER[self.boundary] < _BOUNDARY_ORDER[other.boundary]
+
+    def __le__(self, other: Self) -> bool:
+        if self.value != other.value:
+            return self.value < other.value
+
+        return _BOUNDARY_ORDER[self.boundary] <= _BOUNDARY_ORDER[other.boundary]
+
+    def __gt__(self, other: Self) -> bool:
+        if self.value != other.value:
+            return other.value < self.value
+
+        return _BOUNDARY_ORDER[self.boundary] > _BOUNDARY_ORDER[other.boundary]
+
+    def __ge__(self, other: Self) -> bool:
+        if self.value != other.value:
+            return other.value < self.value
+
+        return _BOUNDARY_ORDER[self.boundary] >= _BOUNDARY_ORDER[other.boundary]
 
     def __str__(self):
         if self.boundary in "([":
@@ -53,47 +75,53 @@ def _merge(
     """
     Merge two sorted lists of endpoints with a given set operation.
 
-    This is a sweep-line algorithm; as each endpoint is encountered one of
-    `inside_a` or `inside_b` is flipped depending on whether the point belongs
-    to `a` or `b`. This may flip `inside_region` (depending on `op`) which adds
-    a new endpoint to the output.
+    This is a sweep-line algorithm; as each endpoint is encountered one of the
+    `inside` bits is flipped depending on whether the point belongs to `a` or `b`.
+    This may flip `inside_region` (depending on `op`) which adds a new endpoint
+    to the output.
     """
     endpoints: list[Endpoint] = []
     i: int = 0
     j: int = 0
-    inside_a: bool = False
-    inside_b: bool = False
+    inside: int = 0  # Bit 1 is set while inside `a`, bit 0 while inside `b`.
     inside_region: bool = False
-
-    while i < len(a) or j < len(b):
-        if i >= len(a):
-            current_endpoint = current_b = b[j]
-            current_a = None
-        elif j >= len(b):
-            current_endpoint = current_a = a[i]
-            current_b = None
-        else:
-            current_a = a[i]
-            current_b = b[j]
-            current_endpoint = min(current_a, current_b)
-
-        if current_a == current_endpoint:
-            inside_a = not inside_a
+    # Tabulate `op` and the boundary swaps below once instead of per endpoint.
+    regions = tuple(op(bool(bits & 2), bool(bits & 1)) for bits in range(4))
+    swap_a_in_b = op is xor
+    swap_b_in_a = op is sub or op is xor
+    len_a = len(a)
+    len_b = len(b)
+
+    while i < len_a and j < len_b:
+        current_a = a[i]
+        current_b = b[j]
+        if current_a.value != current_b.value:
+            from_a = current_a.value < current_b.value
+            from_b = not from_a
+        else:  # Both are taken only if they are the same endpoint.
+            order_a = _BOUNDARY_ORDER[current_a.boundary]
+            order_b = _BOUNDARY_ORDER[current_b.boundary]
+            from_a = order_a <= order_b
+            from_b = order_b <= order_a
+        current_endpoint = current_a if from_a else current_b
+
+        if from_a:
+            inside ^= 2
             i += 1
 
-        if current_b == current_endpoint:
-            inside_b = not inside_b
+        if from_b:
+            inside ^= 1
             j += 1
 
-        if op(inside_a, inside_b) != inside_region:
+        if regions[inside] != inside_region:
             inside_region = not inside_region
 
             # Boundary types can swap when differencing depending on
             # whether the endpoint is inside a region.
             is_closed = current_endpoint.boundary in "[]"
-            b_in_a = inside_a and current_b == current_endpoint
-            a_in_b = inside_b and current_a == current_endpoint
-            if op is sub and b_in_a or op is xor and (a_in_b or b_in_a):
+            if (swap_b_in_a and inside & 2 and from_b) or (
+                swap_a_in_b and inside & 1 and from_a
+            ):
                 is_closed = not is_closed
 
             boundary = (")(", "][")[is_closed][len(endpoints) % 2 == 0]
@@ -104,13 +132,73 @@ def _merge(
                 and endpoints[-1].boundary + boundary not in {"[]", ")("}
             ):  # Remove redundant endpoints such as `0), [0` or `(0, 0]`.
                 endpoints.pop()
+            elif current_endpoint.boundary == boundary:
+                # Endpoints are immutable, so unchanged ones can be shared.
+                endpoints.append(current_endpoint)
             else:
                 endpoints.append(Endpoint(current_endpoint.value, boundary))
 
+    # The exhausted list is now outside, so the rest of the other list is either
+    # all kept or all dropped. `Gaps` are minimally expressed, so only its first
+    # endpoint can be redundant.
+    if i < len_a:
+        rest, k, keep = a, i, regions[2]
+    else:
+        rest, k, keep = b, j, regions[1]
+
+    if keep and k < len(rest):
+        if (
+            len(endpoints) > 0
+            and endpoints[-1].value == rest[k].value
+            and endpoints[-1].boundary + rest[k].boundary not in {"[]", ")("}
+        ):
+            endpoints.pop()
+            k += 1
+        endpoints.extend(rest[k:])
+
     return endpoints
 
 
-@dataclass
+def _overlap[T: SupportsLessThan](
+    endpoints: list[Endpoint[T]], low: T, high: T
+) -> tuple[int, int]:
+    """
+    Return the start and stop of the intervals in `endpoints` that may meet `[low, high]`.
+
+    Every interval outside the returned slice lies strictly below `low` or strictly
+    above `high`.
+    """
+    start = bisect_left(endpoints, low, key=_VALUE_GETTER)
+    stop = bisect_right(endpoints, high, key=_VALUE_GETTER)
+    # Round outwards so that the slice contains whole intervals.
+    return start - start % 2, stop + stop % 2
+
+
+def _merge_overlap(
+    a: list[Endpoint], b: list[Endpoint], op: Callable[[bool, bool], bool]
+) -> list[Endpoint]:
+    """
+    Merge two non-empty sorted lists of endpoints, sweeping only where they overlap.
+
+    Intervals of one list outside the span of the other are disjoint from it, so they
+    are copied to or dropped from the output as `op` dictates instead of being swept.
+    This relies on both lists being minimally expressed, as `Gaps` ensures.
+    """
+    a_start, a_stop = _overlap(a, b[0].value, b[-1].value)
+    b_start, b_stop = _overlap(b, a[0].value, a[-1].value)
+    endpoints = _merge(a[a_start:a_stop], b[b_start:b_stop], op)
+
+    # At most one of `a` or `b` has intervals before the other starts, and
+    # at most one has intervals after the other ends.
+    if op(True, False):
+        endpoints = a[:a_start] + endpoints + a[a_stop:]
+    if op(False, True):
+        endpoints = b[:b_start] + endpoints + b[b_stop:]
+
+    return endpoints
+
+
+@dataclass(slots=True, weakref_slot=True)
 class Gaps[T: SupportsLessThan]:
     """
     A set of mutually exclusive continuous intervals.
@@ -139,17 +227,31 @@ class Gaps[T: SupportsLessThan]:
             elif i % 2 == 1 and endpoint.boundary in "([":
                 raise ValueError(f"Expected right boundary, got {endpoint!r}.")
 
-        halfopen = {"](", ")[", "(]", "[)"}
+        # Equal-valued neighbours must be a singleton `[0, 0]` or a missing point `0), (0`.
+        redundant = {"](", ")[", "(]", "[)", "][", "()"}
         for i in range(len(self.endpoints) - 1):
             a = self.endpoints[i]
             b = self.endpoints[i + 1]
             if a.value > b.value:
                 raise ValueError("Intervals unsorted.")
-            if a.value == b.value and a.boundary + b.boundary in halfopen:
+            if a.value == b.value and a.boundary + b.boundary in redundant:
                 raise ValueError(
                     f"Intervals not minimally expressed. Endpoints {a!r} and {b!r} should be omitted."
                 )
 
+    @classmethod
+    def _from_trusted(cls, endpoints: list[Endpoint[T]]) -> Self:
+        """
+        Create gaps from endpoints without validating them.
+
+        `endpoints` must already satisfy `__post_init__`: sorted, alternating left and
+        right boundaries, and minimally expressed. Results of `_merge` and slices of
+        existing `Gaps` do.
+        """
+        gaps = cls.__new__(cls)
+        gaps.endpoints = endpoints
+        return gaps
+
     @classmethod
     def from_string(cls, gaps: str) -> Self:
         """
@@ -176,9 +278,13 @@ class Gaps[T: SupportsLessThan]:
             else:
                 raise ValueError(f"Invalid endpoint ({endpoint!r}).")
 
-            try:
-                value = int(value)
-            except ValueError:
+            # Deciding up front avoids raising and catching for every float.
+            if value.strip().lstrip("+-").replace("_", "").isdecimal():
+                try:
+                    value = int(value)
+                except ValueError:  # Too many digits for `int`.
+                    value = float(value)
+            else:
                 value = float(value)
 
             endpoints[i] = Endpoint(value, boundary)
@@ -186,29 +292,48 @@ class Gaps[T: SupportsLessThan]:
         return cls(endpoints)
 
     def __or__(self, other: Self) -> Self:
-        return Gaps(_merge(self.endpoints, other.endpoints, or_))
+        if not self:
+            return Gaps._from_trusted(other.endpoints.copy())
+        if not other:
+            return Gaps._from_trusted(self.endpoints.copy())
+        return Gaps._from_trusted(_merge_overlap(self.endpoints, other.endpoints, or_))
 
     def __and__(self, other: Self) -> Self:
-        return Gaps(_merge(self.endpoints, other.endpoints, and_))
+        if not self or not other:
+            return Gaps()
+        return Gaps._from_trusted(_merge_overlap(self.endpoints, other.endpoints, and_))
 
     def __xor__(self, other: Self) -> Self:
-        return Gaps(_merge(self.endpoints, other.endpoints, xor))
+        if not self:
+            return Gaps._from_trusted(other.endpoints.copy())
+        if not other:
+            return Gaps._from_trusted(self.endpoints.copy())
+        return Gaps._from_trusted(_merge_overlap(self.endpoints, other.endpoints, xor))
 
     def __sub__(self, other: Self) -> Self:
-        return Gaps(_merge(self.endpoints, other.endpoints, sub))
+        if not self or not other:
+            return Gaps._from_trusted(self.endpoints.copy())
+        return Gaps._from_trusted(_merge_overlap(self.endpoints, other.endpoints, sub))
 
     def __bool__(self):
         return len(self.endpoints) > 0
 
     def __contains__(self, value: T) -> bool:
-        i = bisect(self.endpoints, value, key=attrgetter("value"))
+        i = bisect(self.endpoints, value, key=_VALUE_GETTER)
         if i == 0:
             return False
 
         if self.endpoints[i - 1].value == value:
             return self.endpoints[i - 1].boundary in "[]"
 
-        return self.endpoints[i].boundary in "])"
+        # Endpoints alternate left and right, so an odd `i` is inside an interval.
+        return i % 2 == 1
 
     def __str__(self):
-        return f"{{{", ".join(str(endpoint) for endpoint in self.endpoints)}}}"
+        intervals = ", ".join(
+            [
+                f"{start.boundary}{start.value}, {end.value}{end.boundary}"
+                for start, end in zip(self.endpoints[::2], self.endpoints[1::2])
+            ]
+        )
+        return f"{{{intervals}}}"
@@ -0,0 +1,28 @@
+from mind_the_gaps import Endpoint
+
+
+def test_values_ordered():
+    assert Endpoint(0, "]") < Endpoint(1, "[")
+    assert Endpoint(1, "[") > Endpoint(0, "]")
+
+
+def test_boundaries_ordered():
+    a = Endpoint(0, ")")
+    b = Endpoint(0, "[")
+    c = Endpoint(0, "]")
+    d = Endpoint(0, "(")
+    assert a < b < c < d
+    assert d > c > b > a
+
+
+def test_equal_endpoints():
+    a = Endpoint(0, "[")
+    b = Endpoint(0, "[")
+    assert a <= b
+    assert a >= b
+    assert not a < b
+    assert not a > b
+
+
+def test_min():
+    assert min(Endpoint(0, "]"), Endpoint(0, "[")) == Endpoint(0, "[")
@@ -29,3 +29,23 @@ def test_bounded_missing_singleton():
 
 def test_from_string_empty():
     assert Gaps.from_string("{}") == Gaps()
+
+
+def test_from_string_float():
+    assert Gaps.from_string("{[-1.5, 2], (3, 4.25)}") == Gaps(
+        [-1.5, 2, Endpoint(3, "("), Endpoint(4.25, ")")]
+    )
+    assert isinstance(Gaps.from_string("{[-1, +2]}").endpoints[1].value, int)
+
+    multiline = Gaps.from_string("{[0,\n1], [2.5,\t3]}")
+    assert multiline == Gaps([0, 1, 2.5, 3])
+    assert [type(endpoint.value) for endpoint in multiline.endpoints] == [
+        int,
+        int,
+        float,
+        int,
+    ]
+
+
+def test_from_string_too_many_digits():
+    assert Gaps.from_string("{[0, " + "1" * 5000 + "]}") == Gaps([0, float("inf")])
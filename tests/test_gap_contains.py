@@ -15,3 +15,27 @@ def test_right_open_not_contained():
 
 def test_right_closed_contained():
     assert 1 in Gaps([0, 1])
+
+
+def test_interior_contained():
+    assert 0.5 in Gaps([0, 1])
+
+
+def test_between_intervals_not_contained():
+    assert 2 not in Gaps([0, 1, 3, 4])
+
+
+def test_past_last_endpoint_not_contained():
+    assert 2 not in Gaps([0, 1])
+
+
+def test_missing_singleton_not_contained():
+    assert 1 not in Gaps([0, Endpoint(1, ")"), Endpoint(1, "("), 2])
+
+
+def test_contains_after_reassigning_endpoints():
+    gaps = Gaps([0, 1])
+    assert 0.5 in gaps
+    gaps.endpoints = [Endpoint(5, "["), Endpoint(6, "]")]
+    assert 5.5 in gaps
+    assert 0.5 not in gaps
@@ -1,4 +1,7 @@
+import weakref
+
 import pytest
+
 from mind_the_gaps import Endpoint, Gaps
 
 
@@ -36,6 +39,19 @@ def test_not_minimal_closed_open():
         Gaps([0, Endpoint(0, ")"), 1, 2])
 
 
+def test_not_minimal_closed_closed():
+    with pytest.raises(ValueError, match="not minimally expressed"):
+        Gaps([0, 1, 1, 2])
+
+
+def test_not_minimal_empty_open():
+    with pytest.raises(ValueError, match="not minimally expressed"):
+        Gaps([Endpoint(0, "("), Endpoint(0, ")")])
+
+    with pytest.raises(ValueError, match="not minimally expressed"):
+        Gaps([Endpoint(0, "("), Endpoint(0, ")"), 3, 4])
+
+
 def test_wrong_boundary_left_closed():
     with pytest.raises(ValueError, match="left"):
         Gaps([Endpoint(0, "]"), 1])
@@ -59,3 +75,8 @@ def test_wrong_boundary_right_open():
 def test_wrong_number_of_endpoints():
     with pytest.raises(ValueError, match="endpoints"):
         Gaps([0, 1, 2])
+
+
+def test_weakref():
+    gaps = Gaps([0, 1])
+    assert weakref.ref(gaps)() is gaps
@@ -0,0 +1,29 @@
+from mind_the_gaps import Endpoint, Gaps
+
+
+def test_str_empty():
+    assert str(Gaps()) == "{}"
+
+
+def test_str_closed():
+    assert str(Gaps([0, 1, 2, 3])) == "{[0, 1], [2, 3]}"
+
+
+def test_str_open():
+    assert str(Gaps([Endpoint(0, "("), Endpoint(1, ")")])) == "{(0, 1)}"
+
+
+def test_str_half_open():
+    assert str(Gaps([0, Endpoint(1, ")"), Endpoint(2, "("), 3])) == "{[0, 1), (2, 3]}"
+
+
+def test_str_singleton():
+    assert str(Gaps([3, 3])) == "{[3, 3]}"
+
+
+def test_str_unbounded():
+    assert str(Gaps([Endpoint(-float("inf"), "("), 0])) == "{(-inf, 0]}"
+
+
+def test_str_missing_singleton():
+    assert str(Gaps([0, Endpoint(1, ")"), Endpoint(1, "("), 2])) == "{[0, 1), (1, 2]}"
@@ -1,37 +1,47 @@
-from mind_the_gaps import Endpoint, Gaps
-
-
-def test_bounded_disjoint():
-    a = Gaps([0, 1])
-    b = Gaps([2, 3])
-    assert a & b == Gaps()
-
-
-def test_unbounded_disjoint():
-    a = Gaps([-float("inf"), 0])
-    b = Gaps([1, 2])
-    assert a & b == Gaps()
-
-
-def test_bounded_intersecting_proper():
-    a = Gaps([0, 2])
-    b = Gaps([1, 3])
-    assert a & b == Gaps([1, 2])
-
-
-def test_bounded_intersecting_singleton():
-    a = Gaps([0, 2])
-    b = Gaps([1, 1])
-    assert a & b == b
-
-
-def test_bounded_missing_singleton():
-    a = Gaps([0, 2])
-    b = Gaps([0, Endpoint(1, ")"), Endpoint(1, "("), 2])
-    assert a & b == b
+import pytest
 
+from mind_the_gaps import Endpoint, Gaps
 
-def test_empty_intersection():
-    a = Gaps([0, 2])
-    b = Gaps()
-    assert a & b == b
+CASES = [
+    pytest.param(Gaps([0, 1]), Gaps([2, 3]), Gaps(), id="bounded_disjoint"),
+    pytest.param(
+        Gaps([-float("inf"), 0]), Gaps([1, 2]), Gaps(), id="unbounded_disjoint"
+    ),
+    pytest.param(
+        Gaps([0, 2]), Gaps([1, 3]), Gaps([1, 2]), id="bounded_intersecting_proper"
+    ),
+    pytest.param(
+        Gaps([0, 2]),
+        Gaps([1, 1]),
+        Gaps([1, 1]),
+        id="bounded_intersecting_singleton",
+    ),
+    pytest.param(
+        Gaps([0, 2]),
+        Gaps([0, Endpoint(1, ")"), Endpoint(1, "("), 2]),
+        Gaps([0, Endpoint(1, ")"), Endpoint(1, "("), 2]),
+        id="bounded_missing_singleton",
+    ),
+    pytest.param(Gaps([0, 2]), Gaps(), Gaps(), id="empty_intersection"),
+    pytest.param(Gaps(), Gaps([0, 2]), Gaps(), id="empty_left_intersection"),
+    pytest.param(
+        Gaps([0, 1, 2, 3, 4, 5, 6, 7]),
+        Gaps([3, 4]),
+        Gaps([3, 3, 4, 4]),
+        id="many_and_one_touching",
+    ),
+    pytest.param(
+        Gaps([3, 4]),
+        Gaps([0, 1, 2, 3, 4, 5, 6, 7]),
+        Gaps([3, 3, 4, 4]),
+        id="one_and_many_touching",
+    ),
+    pytest.param(
+        Gaps([0, 1]), Gaps([1, 2]), Gaps([1, 1]), id="bounded_touching_closed"
+    ),
+]
+
+
+@pytest.mark.parametrize(("a", "b", "expected"), CASES)
+def test_intersection(a, b, expected):
+    assert a & b == expected
@@ -1,37 +1,68 @@
-from mind_the_gaps import Endpoint, Gaps
-
-
-def test_bounded_disjoint():
-    a = Gaps([0, 1])
-    b = Gaps([2, 3])
-    assert a - b == a
-
-
-def test_unbounded_disjoint():
-    a = Gaps([-float("inf"), 0])
-    b = Gaps([1, 2])
-    assert a - b == a
-
-
-def test_bounded_intersecting_proper():
-    a = Gaps([0, 2])
-    b = Gaps([1, 3])
-    assert a - b == Gaps([0, Endpoint(1, ")")])
-
-
-def test_bounded_intersecting_singleton():
-    a = Gaps([0, 2])
-    b = Gaps([1, 1])
-    assert a - b == Gaps([0, Endpoint(1, ")"), Endpoint(1, "("), 2])
+import pytest
 
+from mind_the_gaps import Endpoint, Gaps
 
-def test_bounded_missing_singleton():
-    a = Gaps([0, 2])
-    b = Gaps([0, Endpoint(1, ")"), Endpoint(1, "("), 2])
-    assert a - b == Gaps([1, 1])
+CASES = [
+    pytest.param(Gaps([0, 1]), Gaps([2, 3]), Gaps([0, 1]), id="bounded_disjoint"),
+    pytest.param(
+        Gaps([-float("inf"), 0]),
+        Gaps([1, 2]),
+        Gaps([-float("inf"), 0]),
+        id="unbounded_disjoint",
+    ),
+    pytest.param(
+        Gaps([0, 2]),
+        Gaps([1, 3]),
+        Gaps([0, Endpoint(1, ")")]),
+        id="bounded_intersecting_proper",
+    ),
+    pytest.param(
+        Gaps([0, 2]),
+        Gaps([1, 1]),
+        Gaps([0, Endpoint(1, ")"), Endpoint(1, "("), 2]),
+        id="bounded_intersecting_singleton",
+    ),
+    pytest.param(
+        Gaps([0, 2]),
+        Gaps([0, Endpoint(1, ")"), Endpoint(1, "("), 2]),
+        Gaps([1, 1]),
+        id="bounded_missing_singleton",
+    ),
+    pytest.param(Gaps([0, 2]), Gaps(), Gaps([0, 2]), id="empty_subtraction"),
+    pytest.param(Gaps(), Gaps([0, 2]), Gaps(), id="empty_left_subtraction"),
+    pytest.param(
+        Gaps([0, 0, 1, Endpoint(2, ")"), Endpoint(2, "("), 3]),
+        Gaps(),
+        Gaps([0, 0, 1, Endpoint(2, ")"), Endpoint(2, "("), 3]),
+        id="empty_subtraction_singleton_and_missing_singleton",
+    ),
+    pytest.param(
+        Gaps([0, 1]),
+        Gaps([1, 2]),
+        Gaps([0, Endpoint(1, ")")]),
+        id="bounded_touching_closed",
+    ),
+    pytest.param(
+        Gaps([0, 1, 2, 3, 4, 5, 6, 7]),
+        Gaps([3, 4]),
+        Gaps([0, 1, 2, Endpoint(3, ")"), Endpoint(4, "("), 5, 6, 7]),
+        id="many_sub_one_touching",
+    ),
+    pytest.param(
+        Gaps([3, 4]),
+        Gaps([0, 1, 2, 3, 4, 5, 6, 7]),
+        Gaps([Endpoint(3, "("), Endpoint(4, ")")]),
+        id="one_sub_many_touching",
+    ),
+    pytest.param(
+        Gaps([0, 0, 2, Endpoint(3, ")"), Endpoint(3, "("), 4, 10, 11]),
+        Gaps([10.5, 12]),
+        Gaps([0, 0, 2, Endpoint(3, ")"), Endpoint(3, "("), 4, 10, Endpoint(10.5, ")")]),
+        id="many_sub_one_outside_window",
+    ),
+]
 
 
-def test_empty_subtraction():
-    a = Gaps([0, 2])
-    b = Gaps()
-    assert a - b == a
+@pytest.mark.parametrize(("a", "b", "expected"), CASES)
+def test_subtraction(a, b, expected):
+    assert a - b == expected
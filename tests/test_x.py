@@ -1,21 +1,23 @@
-from mind_the_gaps import Endpoint, Gaps, x
-
-
-def test_x_closed():
-    assert Gaps([0 <= x, x <= 1, 2 <= x, x <= 3]) == Gaps([0, 1, 2, 3])
-
-
-def test_x_open():
-    assert Gaps([0 < x, x < 1, 2 < x, x < 3]) == Gaps(
-        [Endpoint(0, "("), Endpoint(1, ")"), Endpoint(2, "("), Endpoint(3, ")")]
-    )
-
-
-def test_x_singleton():
-    assert Gaps([0 <= x, x <= 0]) == Gaps([0, 0])
+import pytest
 
+from mind_the_gaps import Endpoint, Gaps, x
 
-def test_missing_singleton():
-    assert Gaps([0 <= x, x < 1, 1 < x, x <= 2]) == Gaps(
-        [0, Endpoint(1, ")"), Endpoint(1, "("), 2]
-    )
+CASES = [
+    pytest.param([0 <= x, x <= 1, 2 <= x, x <= 3], Gaps([0, 1, 2, 3]), id="x_closed"),
+    pytest.param(
+        [0 < x, x < 1, 2 < x, x < 3],
+        Gaps([Endpoint(0, "("), Endpoint(1, ")"), Endpoint(2, "("), Endpoint(3, ")")]),
+        id="x_open",
+    ),
+    pytest.param([0 <= x, x <= 0], Gaps([0, 0]), id="x_singleton"),
+    pytest.param(
+        [0 <= x, x < 1, 1 < x, x <= 2],
+        Gaps([0, Endpoint(1, ")"), Endpoint(1, "("), 2]),
+        id="missing_singleton",
+    ),
+]
+
+
+@pytest.mark.parametrize(("endpoints", "expected"), CASES)
+def test_x(endpoints, expected):
+    assert Gaps(endpoints) == expected
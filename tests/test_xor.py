@@ -1,37 +1,101 @@
-from mind_the_gaps import Endpoint, Gaps
-
-
-def test_bounded_disjoint():
-    a = Gaps([0, 1])
-    b = Gaps([2, 3])
-    assert a ^ b == Gaps([0, 1, 2, 3])
-
-
-def test_unbounded_disjoint():
-    a = Gaps([-float("inf"), 0])
-    b = Gaps([1, 2])
-    assert a ^ b == Gaps([-float("inf"), 0, 1, 2])
+import pytest
 
+from mind_the_gaps import Endpoint, Gaps
 
-def test_bounded_intersecting_proper():
-    a = Gaps([0, 2])
-    b = Gaps([1, 3])
-    assert a ^ b == Gaps([0, Endpoint(1, ")"), Endpoint(2, "("), 3])
-
-
-def test_bounded_intersecting_singleton():
-    a = Gaps([0, 2])
-    b = Gaps([1, 1])
-    assert a ^ b == Gaps([0, Endpoint(1, ")"), Endpoint(1, "("), 2])
-
+MANY_XOR_ONE = Gaps(
+    [
+        0,
+        1,
+        2,
+        Endpoint(3, ")"),
+        Endpoint(3, "("),
+        Endpoint(4, ")"),
+        Endpoint(4, "("),
+        5,
+        6,
+        7,
+    ]
+)
 
-def test_bounded_missing_singleton():
-    a = Gaps([0, 2])
-    b = Gaps([0, Endpoint(1, ")"), Endpoint(1, "("), 2])
-    assert a ^ b == Gaps([1, 1])
+CASES = [
+    pytest.param(Gaps([0, 1]), Gaps([2, 3]), Gaps([0, 1, 2, 3]), id="bounded_disjoint"),
+    pytest.param(
+        Gaps([-float("inf"), 0]),
+        Gaps([1, 2]),
+        Gaps([-float("inf"), 0, 1, 2]),
+        id="unbounded_disjoint",
+    ),
+    pytest.param(
+        Gaps([0, 2]),
+        Gaps([1, 3]),
+        Gaps([0, Endpoint(1, ")"), Endpoint(2, "("), 3]),
+        id="bounded_intersecting_proper",
+    ),
+    pytest.param(
+        Gaps([0, 2]),
+        Gaps([1, 1]),
+        Gaps([0, Endpoint(1, ")"), Endpoint(1, "("), 2]),
+        id="bounded_intersecting_singleton",
+    ),
+    pytest.param(
+        Gaps([0, 2]),
+        Gaps([0, Endpoint(1, ")"), Endpoint(1, "("), 2]),
+        Gaps([1, 1]),
+        id="bounded_missing_singleton",
+    ),
+    pytest.param(Gaps([0, 2]), Gaps(), Gaps([0, 2]), id="empty_xor"),
+    pytest.param(Gaps(), Gaps([0, 2]), Gaps([0, 2]), id="empty_left_xor"),
+    pytest.param(
+        Gaps([0, 0, 1, Endpoint(2, ")"), Endpoint(2, "("), 3]),
+        Gaps(),
+        Gaps([0, 0, 1, Endpoint(2, ")"), Endpoint(2, "("), 3]),
+        id="empty_xor_singleton_and_missing_singleton",
+    ),
+    pytest.param(
+        Gaps(),
+        Gaps([0, 0, 1, Endpoint(2, ")"), Endpoint(2, "("), 3]),
+        Gaps([0, 0, 1, Endpoint(2, ")"), Endpoint(2, "("), 3]),
+        id="empty_left_xor_singleton_and_missing_singleton",
+    ),
+    pytest.param(
+        Gaps([0, 1]),
+        Gaps([1, 2]),
+        Gaps([0, Endpoint(1, ")"), Endpoint(1, "("), 2]),
+        id="bounded_touching_closed",
+    ),
+    pytest.param(
+        Gaps([0, 1, 2, 3, 4, 5, 6, 7]),
+        Gaps([3, 4]),
+        MANY_XOR_ONE,
+        id="many_xor_one_touching",
+    ),
+    pytest.param(
+        Gaps([3, 4]),
+        Gaps([0, 1, 2, 3, 4, 5, 6, 7]),
+        MANY_XOR_ONE,
+        id="one_xor_many_touching",
+    ),
+    pytest.param(
+        Gaps([0, 1]),
+        Gaps([Endpoint(1, "("), 2]),
+        Gaps([0, 2]),
+        id="closed_touching_open",
+    ),
+    pytest.param(
+        Gaps([0, Endpoint(1, ")")]),
+        Gaps([Endpoint(1, "("), 2]),
+        Gaps([0, Endpoint(1, ")"), Endpoint(1, "("), 2]),
+        id="open_touching_open",
+    ),
+    pytest.param(
+        Gaps([0, Endpoint(1, ")")]),
+        Gaps([1, 1]),
+        Gaps([0, 1]),
+        id="open_touching_singleton",
+    ),
+]
 
 
-def test_empty_xor():
-    a = Gaps([0, 2])
-    b = Gaps()
-    assert a ^ b == a
+@pytest.mark.parametrize(("a", "b", "expected"), CASES)
+def test_xor(a, b, expected):
+    assert a ^ b == expected